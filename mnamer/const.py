@@ -4,13 +4,9 @@ from datetime import date, datetime
 from pathlib import Path
 from platform import platform, python_version
 from sys import argv, gettrace, version_info
+from typing import Any, Dict
 
 from appdirs import __version__ as appdirs_version, user_cache_dir
-from babelfish import __version__ as babelfish_version
-from guessit import __version__ as guessit_version
-from requests import __version__ as requests_version
-from requests_cache import __version__ as requests_cache_version
-from teletype import VERSION as teletype_version
 
 from mnamer.__version__ import VERSION
 
@@ -24,6 +20,7 @@ __all__ = [
     "USAGE",
     "VERSION",
     "VERSION_MAJOR",
+    "system_info",
 ]
 
 
@@ -47,13 +44,29 @@ SYSTEM = {
     "python version": python_version(),
     "mnamer version": VERSION,
     "appdirs version": appdirs_version,
-    "babelfish version": babelfish_version,
-    "guessit version": guessit_version,
-    "requests version": requests_version,
-    "requests cache version": requests_cache_version,
-    "teletype version": teletype_version,
 }
 
 USAGE = "USAGE: mnamer [preferences] [directives] target [targets ...]"
 
 VERSION_MAJOR = int(VERSION[0])
+
+
+def system_info() -> Dict[str, Any]:
+    """
+    Returns SYSTEM along with dependency versions; these are imported on demand
+    since loading guessit and babelfish dominates start-up time.
+    """
+    from babelfish import __version__ as babelfish_version
+    from guessit import __version__ as guessit_version
+    from requests import __version__ as requests_version
+    from requests_cache import __version__ as requests_cache_version
+    from teletype import VERSION as teletype_version
+
+    return {
+        **SYSTEM,
+        "babelfish version": babelfish_version,
+        "guessit version": guessit_version,
+        "requests version": requests_version,
+        "requests cache version": requests_cache_version,
+        "teletype version": teletype_version,
+    }
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Tuple
 
 from mnamer import tty
-from mnamer.const import SYSTEM, USAGE, VERSION
+from mnamer.const import USAGE, VERSION, system_info
 from mnamer.exceptions import (
     MnamerAbortException,
     MnamerException,
@@ -10,6 +11,7 @@ from mnamer.exceptions import (
     MnamerNotFoundException,
     MnamerSkipException,
 )
+from mnamer.metadata import Metadata
 from mnamer.setting_store import SettingStore
 from mnamer.target import Target
 from mnamer.types import MessageType
@@ -20,6 +22,8 @@ from mnamer.utils import (
     remove_empty_directory,
 )
 
+BATCH_QUERY_WORKERS = 4
+
 
 class Frontend(ABC):
     settings: SettingStore
@@ -55,8 +59,12 @@ class Frontend(ABC):
             )
 
     def _print_configuration(self) -> None:
+        # system_info imports dependencies just to read their versions, so it
+        # is only worth building when the configuration is actually printed
+        if not self.settings.verbose:
+            return
         tty.msg("\nsystem", debug=True)
-        tty.msg(SYSTEM, debug=True)
+        tty.msg(system_info(), debug=True)
         tty.msg("\nsettings", debug=True)
         tty.msg(self.settings.as_dict(), debug=True)
         tty.msg("\ntargets", debug=True)
@@ -91,15 +99,38 @@ class Cli(Frontend):
             tty.msg("no media files found", MessageType.ALERT)
             raise SystemExit(0)
 
+    def _queries(
+        self,
+    ) -> Iterator[Tuple[Target, Callable[[], List[Metadata]]]]:
+        """
+        Pairs each target with a callable returning its provider matches. Batch
+        mode never prompts, so its network-bound lookups are run concurrently
+        ahead of the serial relocation loop.
+        """
+        if not self.settings.batch:
+            for target in self.targets:
+                yield target, target.query
+            return
+        with ThreadPoolExecutor(max_workers=BATCH_QUERY_WORKERS) as executor:
+            futures = [executor.submit(target.query) for target in self.targets]
+            try:
+                for target, future in zip(self.targets, futures):
+                    yield target, future.result
+            finally:
+                # executor shutdown waits on queued lookups, so drop any that
+                # haven't started if iteration stops early (e.g. on Ctrl-C)
+                for future in futures:
+                    future.cancel()
+
     def _process_targets(self) -> None:
-        for target in self.targets:
+        for target, query in self._queries():
             self._announce_file(target)
             self._list_details(target)
 
             # find match for target
             matches = []
             try:
-                matches = target.query()
+                matches = query()
             except MnamerNotFoundException:
                 tty.msg("no matches found", MessageType.ALERT)
             except MnamerNetworkException:
@@ -1,8 +1,9 @@
 import dataclasses
 import re
 from datetime import date
+from functools import lru_cache
 from string import Formatter
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from mnamer.language import Language
 from mnamer.types import MediaType
@@ -35,6 +36,22 @@ class _MetaFormatter(Formatter):
             return kwargs.get(key, "")
 
 
+_FORMATTER = _MetaFormatter()
+_FORMAT_RE = re.compile(r"({(\w+)(?:\[[\w:]+\])?(?:\:\d{1,2})?})")
+_TITLE_CASE_KEYS = frozenset({"name", "series", "synopsis", "title"})
+
+
+@lru_cache(maxsize=32)
+def _parse_template(template: str) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Splits a format template into (literal, field, key) segments. Templates
+    come from settings and rarely change, so the split is cached per template.
+    """
+    parts = _FORMAT_RE.split(template)
+    parts.extend(("", ""))  # pad the trailing literal into a full segment
+    return tuple(zip(parts[::3], parts[1::3], parts[2::3]))
+
+
 @dataclasses.dataclass
 class Metadata:
     """A dataclass which transforms and stores media metadata information."""
@@ -47,16 +64,18 @@ class Metadata:
     synopsis: str = None
     media: MediaType = None
 
+    _converters = {
+        "container": normalize_container,
+        "group": str.upper,
+        "language": Language.parse,
+        "language_sub": Language.parse,
+        "media": MediaType,
+        "quality": str.lower,
+        "synopsis": str.capitalize,
+    }
+
     def __setattr__(self, key: str, value: Any):
-        converter = {
-            "container": normalize_container,
-            "group": str.upper,
-            "language": Language.parse,
-            "language_sub": Language.parse,
-            "media": MediaType,
-            "quality": str.lower,
-            "synopsis": str.capitalize,
-        }.get(key)
+        converter = self._converters.get(key)
         if value is not None and converter:
             value = converter(value)
         super().__setattr__(key, value)
@@ -75,24 +94,30 @@ class Metadata:
             return self.container
 
     def as_dict(self) -> Dict[str, Any]:
-        d = dataclasses.asdict(self)
+        d = {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
         d["extension"] = self.extension
         return d
 
-    def _format_repl(self, mobj) -> str:
-        format_string, key = mobj.groups()
-        value = _MetaFormatter().vformat(format_string, None, self.as_dict())
-        if key in {"name", "series", "synopsis", "title"}:
-            value = str_title_case(value)
-        return value
+    def _format_template(self, template: str) -> str:
+        field_map = self.as_dict()
+        segments = []
+        for literal, format_string, key in _parse_template(template):
+            segments.append(literal)
+            if not format_string:
+                continue
+            value = _FORMATTER.vformat(format_string, None, field_map)
+            if key in _TITLE_CASE_KEYS:
+                value = str_title_case(value)
+            segments.append(value)
+        return str_fix_padding("".join(segments))
 
     def update(self, metadata: "Metadata"):
         """Overlays all none value from another Metadata instance."""
-        for field in dataclasses.asdict(self).keys():
-            value = getattr(metadata, field)
+        for field in dataclasses.fields(self):
+            value = getattr(metadata, field.name)
             if value is None:
                 continue
-            super().__setattr__(field, value)
+            super().__setattr__(field.name, value)
 
 
 @dataclasses.dataclass
@@ -109,21 +134,15 @@ class MetadataMovie(Metadata):
     id_tmdb: Union[int, str] = None
     media: MediaType = MediaType.MOVIE
 
+    _converters = {
+        **Metadata._converters,
+        "name": fn_pipe(str_replace_slashes, str_title_case),
+        "year": year_parse,
+    }
+
     def __format__(self, format_spec: Optional[str]):
         default = "{name} ({year})"
-        re_pattern = r"({(\w+)(?:\[[\w:]+\])?(?:\:\d{1,2})?})"
-        s = re.sub(re_pattern, self._format_repl, format_spec or default)
-        s = str_fix_padding(s)
-        return s
-
-    def __setattr__(self, key: str, value: Any):
-        converter = {
-            "name": fn_pipe(str_replace_slashes, str_title_case),
-            "year": year_parse,
-        }.get(key)
-        if value is not None and converter:
-            value = converter(value)
-        super().__setattr__(key, value)
+        return self._format_template(format_spec or default)
 
 
 @dataclasses.dataclass
@@ -142,21 +161,15 @@ class MetadataEpisode(Metadata):
     id_tvmaze: Union[int, str] = None
     media: MediaType = MediaType.EPISODE
 
+    _converters = {
+        **Metadata._converters,
+        "date": parse_date,
+        "episode": int,
+        "season": int,
+        "series": fn_pipe(str_replace_slashes, str_title_case),
+        "title": fn_pipe(str_replace_slashes, str_title_case),
+    }
+
     def __format__(self, format_spec: Optional[str]):
         default = "{series} - {season:02}x{episode:02} - {title}"
-        re_pattern = r"({(\w+)(?:\[[\w:]+\])?(?:\:\d{1,2})?})"
-        s = re.sub(re_pattern, self._format_repl, format_spec or default)
-        s = str_fix_padding(s)
-        return s
-
-    def __setattr__(self, key: str, value: Any):
-        converter = {
-            "date": parse_date,
-            "episode": int,
-            "season": int,
-            "series": fn_pipe(str_replace_slashes, str_title_case),
-            "title": fn_pipe(str_replace_slashes, str_title_case),
-        }.get(key)
-        if value is not None and converter:
-            value = converter(value)
-        super().__setattr__(key, value)
+        return self._format_template(format_spec or default)
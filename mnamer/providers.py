@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from datetime import date, datetime
 from os import environ
+from threading import Lock
 from typing import Generator, Optional
 
 from mnamer.endpoints import *
@@ -212,6 +213,7 @@ class Tvdb(Provider):
     def __init__(self, api_key: str = None, cache: bool = True):
         super().__init__(api_key, cache)
         assert self.api_key
+        self._login_lock = Lock()
         self.token = "" if self.cache else self._login()
 
     def _login(self) -> str:
@@ -223,7 +225,10 @@ class Tvdb(Provider):
         """Searches TVDb for movie metadata."""
         assert query
         if not self.token:
-            self.token = self._login()
+            # batch mode searches concurrently; only one of them should log in
+            with self._login_lock:
+                if not self.token:
+                    self.token = self._login()
         if query.id_tvdb and query.date:
             results = self._search_tvdb_date(
                 query.id_tvdb, query.date, query.language
@@ -242,8 +247,7 @@ class Tvdb(Provider):
             )
         else:
             raise MnamerNotFoundException
-        for result in results:
-            yield result
+        yield from results
 
     def _search_id(
         self,
@@ -1,5 +1,6 @@
 import dataclasses
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -377,6 +378,12 @@ class SettingStore:
             if f.metadata
         ]
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _arg_loader(cls) -> ArgLoader:
+        # specifications are static, so the parser is built once and reused
+        return ArgLoader(*cls.specifications())
+
     @staticmethod
     def _resolve_path(path: Union[str, Path]) -> Path:
         return Path(path).resolve()
@@ -431,17 +438,18 @@ class SettingStore:
         [setattr(self, k, v) for k, v in d.items() if v]
 
     def load(self) -> None:
-        arg_loader = ArgLoader(*self.specifications())
+        arg_loader = self._arg_loader()
         try:
             arguments = arg_loader.load()
         except RuntimeError as e:
             raise MnamerException(e)
-        config_path = arguments.get("config_path", crawl_out(".mnamer-v2.json"))
-        config = json_loads(str(config_path)) if config_path else {}
         if not self.config_ignore and not arguments.get("config_ignore"):
-            self.bulk_apply(config)
-        if arguments:
-            self.bulk_apply(arguments)
+            config_path = arguments.get("config_path") or crawl_out(
+                ".mnamer-v2.json"
+            )
+            if config_path:
+                self.bulk_apply(json_loads(str(config_path)))
+        self.bulk_apply(arguments)
 
     def api_for(self, media_type: MediaType) -> Optional[ProviderType]:
         """Returns the ProviderType for a given media type."""
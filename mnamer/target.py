@@ -1,10 +1,10 @@
 from datetime import date
+from functools import lru_cache
+from itertools import islice
 from os import path
 from pathlib import Path, PurePath
 from shutil import move
-from typing import Dict, List, Optional, Set, Union
-
-from guessit import guessit
+from typing import Any, Dict, List, Optional, Set, Union
 
 from mnamer.exceptions import MnamerException
 from mnamer.language import Language
@@ -24,6 +24,34 @@ from mnamer.utils import (
 
 __all__ = ["Target"]
 
+_QUALITY_KEYS = frozenset(
+    {
+        "audio_codec",
+        "audio_profile",
+        "screen_size",
+        "source",
+        "video_codec",
+        "video_profile",
+    }
+)
+
+_METADATA_CLASSES = {
+    MediaType.EPISODE: MetadataEpisode,
+    MediaType.MOVIE: MetadataMovie,
+    None: Metadata,
+}
+
+
+@lru_cache(maxsize=4096)
+def _guessit(file_path: str, media: Optional[MediaType]) -> Dict[str, Any]:
+    """
+    Memoized wrapper for guessit; the returned dict is shared between calls
+    and must be treated as read-only.
+    """
+    from guessit import guessit  # deferred; guessit is slow to import
+
+    return dict(guessit(file_path, {"type": media}))
+
 
 class Target:
     """Manages metadata state for a media file and facilitates its relocation."""
@@ -123,47 +151,33 @@ class Target:
     def _parse(self, file_path: PurePath):
         path_data = {}
         path_data["release_name"] = file_path.parent.name
-        options = {"type": self._settings.media}
-        raw_data = dict(guessit(str(file_path), options))
+        raw_data = _guessit(str(file_path), self._settings.media)
         if isinstance(raw_data.get("season"), list):
-            raw_data = dict(guessit(str(file_path.parts[-1]), options))
+            raw_data = _guessit(file_path.name, self._settings.media)
         for k, v in raw_data.items():
-            if hasattr(v, "alpha3"):
+            if isinstance(v, (int, str, date)):
+                path_data[k] = v
+            elif isinstance(v, list):
+                if v and all(isinstance(_, (int, str)) for _ in v):
+                    path_data[k] = v[0]
+            elif hasattr(v, "alpha3"):
                 try:
                     path_data[k] = Language.parse(v)
                 except MnamerException:
                     continue
-            elif isinstance(v, (int, str, date)):
-                path_data[k] = v
-            elif isinstance(v, list) and all(
-                [isinstance(_, (int, str)) for _ in v]
-            ):
-                path_data[k] = v[0]
         if self._settings.media:
             media_type = self._settings.media
         elif path_data.get("type"):
             media_type = MediaType(path_data["type"])
         else:
             media_type = None
-        meta_cls = {
-            MediaType.EPISODE: MetadataEpisode,
-            MediaType.MOVIE: MetadataMovie,
-            None: Metadata,
-        }[media_type]
+        meta_cls = _METADATA_CLASSES[media_type]
         self.metadata = meta_cls(language=self._settings.language)
         self.metadata.quality = (
             " ".join(
-                path_data[key]
-                for key in path_data
-                if key
-                in (
-                    "audio_codec",
-                    "audio_profile",
-                    "screen_size",
-                    "source",
-                    "video_codec",
-                    "video_profile",
-                )
+                value
+                for key, value in path_data.items()
+                if key in _QUALITY_KEYS
             )
             or None
         )
@@ -232,13 +246,12 @@ class Target:
         results = self._provider.search(self.metadata)
         seen = set()
         response = []
-        for idx, result in enumerate(results, start=1):
-            if str(result) in seen:
+        for result in islice(results, max(self._settings.hits, 1)):
+            label = str(result)
+            if label in seen:
                 continue
             response.append(result)
-            seen.add(str(result))
-            if idx >= self._settings.hits:
-                break
+            seen.add(label)
         return response
 
     def relocate(self) -> None:
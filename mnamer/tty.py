@@ -7,7 +7,7 @@ from teletype import codes
 from teletype.components import ChoiceHelper, SelectOne
 from teletype.io import style_format, style_print
 
-from mnamer.const import SYSTEM
+from mnamer.const import system_info
 from mnamer.exceptions import (
     MnamerAbortException,
     MnamerException,
@@ -144,7 +144,7 @@ def crash_report():  # pragma: no cover
 
 --------------------------------- environment ----------------------------------
 
-{_msg_format(SYSTEM)}
+{_msg_format(system_info())}
 
 --------------------------------- stack trace ----------------------------------
 
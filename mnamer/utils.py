@@ -3,7 +3,7 @@
 import json
 import re
 from datetime import date, datetime
-from os import walk, listdir
+from os import listdir, scandir, stat
 from os.path import (
     exists,
     expanduser,
@@ -14,10 +14,13 @@ from os.path import (
 )
 from shutil import rmtree
 from pathlib import Path, PurePath
+from stat import S_ISDIR, S_ISREG
+from threading import Lock
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 from unicodedata import normalize
 
 import requests_cache
+from requests import Session
 from requests.adapters import HTTPAdapter
 
 from mnamer.const import CACHE_PATH, CURRENT_YEAR, SUBTITLE_CONTAINERS
@@ -55,6 +58,107 @@ __all__ = [
     "year_range_parse",
 ]
 
+_SESSION_LOCK = Lock()
+
+_session: Optional[requests_cache.CachedSession] = None
+_uncached_session: Optional[Session] = None
+
+_DASHES_RE = re.compile(r"-+")
+_DELIMITERS_RE = re.compile(r"( [-.,_])+")
+_DOTS_RE = re.compile(r"\.+")
+_EMPTY_BRACKETS_RE = re.compile(r"\[\s*]")
+_EMPTY_PARENS_RE = re.compile(r"\(\s*\)")
+_SCENE_CHARS_RE = re.compile(r"[^.\d\w/]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_SANITIZE_TABLE = str.maketrans("", "", '<>:"|?*&%=+@#`^')
+
+_TITLE_LOWERCASE_EXCEPTIONS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "as",
+        "at",
+        "but",
+        "by",
+        "de",
+        "des",
+        "du",
+        "for",
+        "from",
+        "in",
+        "is",
+        "le",
+        "nor",
+        "of",
+        "on",
+        "or",
+        "the",
+        "to",
+        "un",
+        "une",
+        "with",
+        "via",
+    }
+)
+
+_TITLE_UPPERCASE_EXCEPTIONS = frozenset(
+    {
+        "i",
+        "ii",
+        "iii",
+        "iv",
+        "v",
+        "vi",
+        "vii",
+        "viii",
+        "ix",
+        "x",
+        "2d",
+        "3d",
+        "au",
+        "aka",
+        "atm",
+        "bbc",
+        "bff",
+        "cia",
+        "csi",
+        "dc",
+        "doa",
+        "espn",
+        "fbi",
+        "ira",
+        "jfk",
+        "lol",
+        "mlb",
+        "mlk",
+        "mtv",
+        "nba",
+        "nfl",
+        "nhl",
+        "nsfw",
+        "nyc",
+        "omg",
+        "pga",
+        "oj",
+        "rsvp",
+        "tnt",
+        "tv",
+        "ufc",
+        "ufo",
+        "uk",
+        "usa",
+        "vip",
+        "wtf",
+        "wwe",
+        "wwi",
+        "wwii",
+        "xxx",
+        "yolo",
+    }
+)
+
 
 def clean_dict(target_dict: Dict[Any, Any], whitelist=None) -> Dict[Any, Any]:
     """Convenience function that removes a dicts keys that have falsy values."""
@@ -75,17 +179,28 @@ def crawl_in(file_paths: List[Path], recurse: bool = False) -> List[Path]:
     """Looks for files amongst or within paths provided."""
     found_files = set()
     for file_path in file_paths:
-        if not file_path.exists():
+        try:
+            mode = stat(file_path).st_mode
+        except OSError:
             continue
-        if file_path.is_file():
-            found_files.add(Path(file_path).absolute())
+        if S_ISREG(mode):
+            found_files.add(str(file_path.absolute()))
             continue
-        for root, _dirs, files in walk(file_path):
-            for file in files:
-                found_files.add(Path(root, file).absolute())
-            if not recurse:
-                break
-    return sorted(list(found_files))
+        if not S_ISDIR(mode):
+            continue
+        directories = [str(file_path.absolute())]
+        while directories:
+            try:
+                entries = scandir(directories.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        found_files.add(entry.path)
+                    elif recurse and not entry.is_symlink():
+                        directories.append(entry.path)
+    return sorted(Path(found_file) for found_file in found_files)
 
 
 def crawl_out(filename: str) -> Optional[Path]:
@@ -112,14 +227,13 @@ def filename_replace(filename: str, replacements: Dict[str, str]) -> str:
 
 def filter_blacklist(paths: List[Path], blacklist: List[str]) -> List[Path]:
     """Filters (set difference) paths by a collection of regex pattens."""
+    patterns = [
+        re.compile(pattern, re.IGNORECASE) for pattern in blacklist if pattern
+    ]
     return [
         path.absolute()
         for path in paths
-        if not any(
-            re.search(pattern, str(path), re.IGNORECASE)
-            for pattern in blacklist
-            if pattern
-        )
+        if not any(pattern.search(str(path)) for pattern in patterns)
     ]
 
 
@@ -185,14 +299,33 @@ def is_subtitle(container: Optional[str]) -> bool:
 
 def get_session() -> requests_cache.CachedSession:
     """Convenience function that returns request-cache session singleton."""
-    if not hasattr(get_session, "session"):
-        get_session.session = requests_cache.CachedSession(
-            cache_name=str(CACHE_PATH), expire_after=518_400  # 6 days
-        )
-        adapter = HTTPAdapter(max_retries=3)
-        get_session.session.mount("http://", adapter)
-        get_session.session.mount("https://", adapter)
-    return get_session.session
+    global _session
+    if _session is None:
+        with _SESSION_LOCK:
+            if _session is None:
+                _session = _mount_retries(
+                    requests_cache.CachedSession(
+                        cache_name=str(CACHE_PATH),
+                        expire_after=518_400,  # 6 days
+                    )
+                )
+    return _session
+
+
+def _get_uncached_session() -> Session:
+    global _uncached_session
+    if _uncached_session is None:
+        with _SESSION_LOCK:
+            if _uncached_session is None:
+                _uncached_session = _mount_retries(Session())
+    return _uncached_session
+
+
+def _mount_retries(session: Session) -> Session:
+    adapter = HTTPAdapter(max_retries=3)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 def get_filesize(path: Union[PurePath, Path]) -> str:
@@ -262,8 +395,6 @@ def request_json(
     transparently by using the package's monkey patching.
     """
     assert url
-    session = get_session()
-
     if isinstance(headers, dict):
         headers = clean_dict(headers)
     else:
@@ -281,9 +412,10 @@ def request_json(
         "like Gecko) Chrome/79.0.3945.88 Safari/537.36"
     )
 
-    initial_cache_state = session._is_cache_disabled  # yes, i'm a bad person
+    # Uncached requests use their own session rather than toggling the shared
+    # cached session, which concurrent batch lookups may be using.
+    session = get_session() if cache else _get_uncached_session()
     try:
-        session._is_cache_disabled = not cache
         response = session.request(
             url=url,
             params=parameters,
@@ -297,8 +429,6 @@ def request_json(
     except:
         content = None
         status = 500
-    finally:
-        session._is_cache_disabled = initial_cache_state
     return status, content
 
 
@@ -306,14 +436,14 @@ def str_fix_padding(s: str) -> str:
     """Truncates and collapses whitespace and delimiters in strings."""
     len_before = len(s)
     # Remove empty brackets
-    s = re.sub(r"\(\s*\)", "", s)
-    s = re.sub(r"\[\s*]", "", s)
+    s = _EMPTY_PARENS_RE.sub("", s)
+    s = _EMPTY_BRACKETS_RE.sub("", s)
     # Collapse dashes
-    s = re.sub(r"-+", "-", s)
+    s = _DASHES_RE.sub("-", s)
     # Collapse whitespace
-    s = re.sub(r"\s+", " ", s)
+    s = _WHITESPACE_RE.sub(" ", s)
     # Collapse repeating delimiters
-    s = re.sub(r"( [-.,_])+", r"\1", s)
+    s = _DELIMITERS_RE.sub(r"\1", s)
     # Strip leading/ trailing whitespace
     s = s.strip()
     # Strip leading/ trailing dashes
@@ -331,7 +461,7 @@ def str_replace(s: str, replacements: Dict[str, str]) -> str:
 
 
 def str_replace_slashes(s: str) -> str:
-    return str_replace(s, {"/": "-", "\\": "-"})
+    return s.replace("/", "-").replace("\\", "-")
 
 
 def str_sanitize(filename: str) -> str:
@@ -341,19 +471,18 @@ def str_sanitize(filename: str) -> str:
         base = base.rstrip(".")
         base, container_prefix = splitext(base)
         container = container_prefix + container
-    base = re.sub(r"\s+", " ", base)
+    base = _WHITESPACE_RE.sub(" ", base)
     drive, tail = splitdrive(base)
-    tail = re.sub(r'[<>:"|?*&%=+@#`^]', "", tail)
+    tail = tail.translate(_SANITIZE_TABLE)
     return drive + tail.strip("-., ") + container
 
 
 def str_scenify(filename: str) -> str:
     """Replaces non ascii-alphanumerics with dots."""
     filename = normalize("NFKD", filename)
-    filename.encode("ascii", "ignore")
-    filename = re.sub(r"\s+", ".", filename)
-    filename = re.sub(r"[^.\d\w/]", "", filename)
-    filename = re.sub(r"\.+", ".", filename)
+    filename = _WHITESPACE_RE.sub(".", filename)
+    filename = _SCENE_CHARS_RE.sub("", filename)
+    filename = _DOTS_RE.sub(".", filename)
     return filename.lower().strip(".")
 
 
@@ -363,86 +492,6 @@ def str_title_case(s: str) -> str:
     if not s:
         return s
 
-    lowercase_exceptions = {
-        "a",
-        "an",
-        "and",
-        "as",
-        "at",
-        "but",
-        "by",
-        "de",
-        "des",
-        "du",
-        "for",
-        "from",
-        "in",
-        "is",
-        "le",
-        "nor",
-        "of",
-        "on",
-        "or",
-        "the",
-        "to",
-        "un",
-        "une",
-        "with",
-        "via",
-    }
-    uppercase_exceptions = {
-        "i",
-        "ii",
-        "iii",
-        "iv",
-        "v",
-        "vi",
-        "vii",
-        "viii",
-        "ix",
-        "x",
-        "2d",
-        "3d",
-        "au",
-        "aka",
-        "atm",
-        "bbc",
-        "bff",
-        "cia",
-        "csi",
-        "dc",
-        "doa",
-        "espn",
-        "fbi",
-        "ira",
-        "jfk",
-        "lol",
-        "mlb",
-        "mlk",
-        "mtv",
-        "nba",
-        "nfl",
-        "nhl",
-        "nsfw",
-        "nyc",
-        "omg",
-        "pga",
-        "oj",
-        "rsvp",
-        "tnt",
-        "tv",
-        "ufc",
-        "ufo",
-        "uk",
-        "usa",
-        "vip",
-        "wtf",
-        "wwe",
-        "wwi",
-        "wwii",
-        "xxx",
-        "yolo",
-    }
     padding_chars = ".- "
     paren_chars = "[](){}<>{}"
     punctuation_chars = paren_chars + "\"!?$,-.:;@_`'"
@@ -472,7 +521,7 @@ def str_title_case(s: str) -> str:
                 s = s[: pos + 1] + s[pos + 1].upper() + s[pos + 2 :]
 
     # process lowercase transformations
-    for exception in lowercase_exceptions:
+    for exception in _TITLE_LOWERCASE_EXCEPTIONS:
         for pos in findall(string_lower, exception):
             starts = pos < 2
             if starts:
@@ -487,7 +536,7 @@ def str_title_case(s: str) -> str:
                 s = s[:pos] + exception.lower() + s[pos + word_length :]
 
     # process uppercase transformations
-    for exception in uppercase_exceptions:
+    for exception in _TITLE_UPPERCASE_EXCEPTIONS:
         for pos in findall(string_lower, exception):
             starts = pos == 0
             prev_char = None if starts else string_lower[pos - 1]
@@ -0,0 +1,83 @@
+from time import sleep
+from unittest.mock import patch
+
+import pytest
+
+from mnamer.exceptions import MnamerNetworkException, MnamerNotFoundException
+from mnamer.frontends import Cli
+from mnamer.setting_store import SettingStore
+from mnamer.target import Target
+
+pytestmark = pytest.mark.local
+
+FILENAMES = ("aladdin.1992.avi", "kill.bill.2003.ts", "the.goonies.1985.mp4")
+
+
+def batch_cli(**kwargs) -> Cli:
+    settings = SettingStore(
+        batch=True, test=True, targets=list(FILENAMES), **kwargs
+    )
+    return Cli(settings)
+
+
+@pytest.mark.parametrize("verbose", (False, True), ids=("quiet", "verbose"))
+@pytest.mark.usefixtures("setup_test_dir")
+def test_print_configuration__system_info(setup_test_files, verbose):
+    setup_test_files(*FILENAMES)
+    with patch("mnamer.frontends.system_info", return_value={}) as mock:
+        batch_cli(verbose=verbose)
+    assert mock.called is verbose
+
+
+@pytest.mark.usefixtures("setup_test_dir")
+def test_queries__batch__paired_in_order(setup_test_files):
+    setup_test_files(*FILENAMES)
+
+    def query(target):
+        # finish in reverse order to ensure results aren't paired by completion
+        sleep(0.02 * (len(FILENAMES) - FILENAMES.index(target.source.name)))
+        return [target.source.name]
+
+    with patch.object(Target, "query", autospec=True, side_effect=query):
+        cli = batch_cli()
+        actual = [(target, query()) for target, query in cli._queries()]
+    expected = [(target, [target.source.name]) for target in cli.targets]
+    assert actual == expected
+
+
+@pytest.mark.usefixtures("setup_test_dir")
+def test_queries__batch__cancels_pending(setup_test_files):
+    setup_test_files(*FILENAMES)
+    queried = []
+
+    def query(target):
+        queried.append(target.source.name)
+        sleep(0.1)
+        return []
+
+    with patch("mnamer.frontends.BATCH_QUERY_WORKERS", 1), patch.object(
+        Target, "query", autospec=True, side_effect=query
+    ):
+        queries = batch_cli()._queries()
+        next(queries)
+        queries.close()
+    assert queried == [FILENAMES[0]]
+
+
+@pytest.mark.usefixtures("setup_test_dir")
+def test_process_targets__batch__query_errors(setup_test_files, capsys):
+    setup_test_files(*FILENAMES[:2])
+    errors = {
+        FILENAMES[0]: MnamerNotFoundException,
+        FILENAMES[1]: MnamerNetworkException,
+    }
+
+    def query(target):
+        raise errors[target.source.name]
+
+    with patch.object(Target, "query", autospec=True, side_effect=query):
+        batch_cli().launch()
+    out = capsys.readouterr().out
+    assert "no matches found" in out
+    assert "network error" in out
+    assert "2 out of 2 files processed successfully" in out
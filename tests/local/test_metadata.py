@@ -137,3 +137,11 @@ def test_metadata_movie__format_with_specifiers():
     expected = "P/Pineapple Express"
     actual = format(metadata, format_spec)
     assert actual == expected
+
+
+def test_metadata_movie__format_language():
+    metadata = MetadataMovie(name="amelie", language="french")
+    format_spec = "{name} [{language}]"
+    expected = "Amelie [fr]"
+    actual = format(metadata, format_spec)
+    assert actual == expected
@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from unittest.mock import patch
+
+import pytest
+
+from mnamer.metadata import MetadataEpisode
+from mnamer.providers import Tvdb
+
+pytestmark = pytest.mark.local
+
+
+def test_tvdb_search__concurrent_login():
+    provider = Tvdb()
+    query = MetadataEpisode(series="Lost")
+
+    def login():
+        sleep(0.05)
+        return "token"
+
+    with patch.object(Tvdb, "_login", side_effect=login) as mock_login:
+        with patch.object(Tvdb, "_search_series", return_value=iter(())):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                searches = [
+                    executor.submit(lambda: list(provider.search(query)))
+                    for _ in range(4)
+                ]
+            for search in searches:
+                search.result()
+    assert mock_login.call_count == 1
+    assert provider.token == "token"
@@ -1,3 +1,6 @@
+import json
+import sys
+
 import pytest
 
 from mnamer.setting_store import SettingStore
@@ -29,3 +32,39 @@ def test_api_key_for(api: ProviderType):
     settings = SettingStore()
     setattr(settings, f"api_key_{api.value}", "xxx")
     assert settings.api_key_for(api) == "xxx"
+
+
+@pytest.fixture
+def load_settings(monkeypatch, setup_test_dir):
+    """Loads a SettingStore using the given arguments and config file."""
+
+    def fn(*args, config=None):
+        if config is not None:
+            with open(".mnamer-v2.json", "w") as fp:
+                json.dump(config, fp)
+        monkeypatch.setattr(sys, "argv", ["mnamer", *args])
+        settings = SettingStore()
+        settings.load()
+        return settings
+
+    return fn
+
+
+def test_load__config(load_settings):
+    settings = load_settings(config={"hits": 10})
+    assert settings.hits == 10
+
+
+def test_load__arguments_override_config(load_settings):
+    settings = load_settings("--hits=3", config={"hits": 10})
+    assert settings.hits == 3
+
+
+def test_load__falsy_argument_keeps_config(load_settings):
+    settings = load_settings("--hits=0", config={"hits": 10})
+    assert settings.hits == 10
+
+
+def test_load__config_ignore(load_settings):
+    settings = load_settings("--config-ignore", config={"hits": 10})
+    assert settings.hits == 5
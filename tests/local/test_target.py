@@ -1,10 +1,14 @@
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from guessit import guessit
 
+from mnamer.metadata import MetadataMovie
 from mnamer.setting_store import SettingStore
 from mnamer.target import *
+from mnamer.target import _guessit
 from mnamer.types import MediaType
 
 pytestmark = pytest.mark.local
@@ -56,6 +60,25 @@ def test_parse__season():
     assert target.metadata.season == 1
 
 
+def test_parse__season__multiple():
+    file_path = Path("show.s01.s02.e03.mkv")
+    target = Target(file_path, SettingStore())
+    assert target.metadata.season == 1
+
+
+@pytest.mark.parametrize(
+    "file_path,expected",
+    (
+        ("/tv/Show.S01.S02/Show.S03E01.mkv", 3),
+        ("/tv/Show S01 S02/show.e03.mkv", None),
+    ),
+    ids=("filename season", "no filename season"),
+)
+def test_parse__season__multiple_in_directory(file_path, expected):
+    target = Target(Path(file_path), SettingStore())
+    assert target.metadata.season == expected
+
+
 def test_parse__series():
     file_path = Path("ninja.turtles.s01e04.1080p.ac3.rargb.sample.mp4")
     target = Target(file_path, SettingStore())
@@ -74,6 +97,15 @@ def testparse__name():
     assert target.metadata.name == "The Goonies"
 
 
+def test_parse__guessit_memoized():
+    file_path = Path("ninja.turtles.s01e04.1080p.ac3.rargb.sample.mp4")
+    _guessit.cache_clear()
+    with patch("guessit.guessit", wraps=guessit) as mock_guessit:
+        Target(file_path, SettingStore())
+        Target(file_path, SettingStore())
+    assert mock_guessit.call_count == 1
+
+
 @pytest.mark.parametrize("media", MediaType)
 def test_media__override(media: MediaType):
     target = Target(Path(), SettingStore(media=media))
@@ -108,8 +140,25 @@ def test_destination__simple():
     target = Target(Path("star.trek.enterprise.s01e1.mkv"))
 
 
-def test_query():
-    pass  # TODO
+@pytest.mark.parametrize(
+    "titles,hits,expected",
+    (
+        (("A", "B", "C"), 2, ["A", "B"]),
+        (("A", "A", "B", "C"), 2, ["A"]),
+        (("A", "B", "B", "C", "D"), 3, ["A", "B"]),
+        (("A", "B"), 0, ["A"]),
+    ),
+    ids=("unique", "leading duplicate", "inner duplicate", "minimum hit"),
+)
+def test_query(titles, hits, expected):
+    target = Target(Path("movie.mkv"), SettingStore(hits=hits))
+    results = iter([MetadataMovie(name=title) for title in titles])
+    with patch.object(target, "_provider") as provider:
+        provider.search.return_value = results
+        actual = [str(result) for result in target.query()]
+    assert actual == [str(MetadataMovie(name=title)) for title in expected]
+    # duplicates count against hits so no extra provider results are pulled
+    assert len(list(results)) == len(titles) - max(hits, 1)
 
 
 def test_relocate():
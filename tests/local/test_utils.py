@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Dict, List
 from unittest.mock import patch
@@ -199,6 +200,21 @@ def test_dir_crawl_in__dirs__recurse(setup_test_files):
     assert set(actual) == set(expected)
 
 
+@pytest.mark.usefixtures("setup_test_dir")
+def test_dir_crawl_in__dirs__unreadable(setup_test_files):
+    setup_test_files("Readable/a.mkv", "Unreadable/b.mkv")
+    unreadable = str(Path("Unreadable").absolute())
+
+    def scandir(path):
+        if path == unreadable:
+            raise PermissionError(path)
+        return os.scandir(path)
+
+    with patch("mnamer.utils.scandir", side_effect=scandir):
+        actual = crawl_in([Path.cwd()], recurse=True)
+    assert actual == [Path("Readable", "a.mkv").absolute()]
+
+
 @pytest.mark.usefixtures("setup_test_dir")
 def test_test_crawl_out__walking(setup_test_files):
     setup_test_files(*TEST_FILES.keys())
@@ -291,6 +307,13 @@ def test_str_scenify__utf8_to_ascii():
     assert actual == expected
 
 
+def test_str_scenify__non_latin():
+    filename = "Брат 2"
+    expected = "брат.2"
+    actual = str_scenify(filename)
+    assert actual == expected
+
+
 @pytest.mark.parametrize("sequence", (list(), set(), tuple()))
 def test_filter_blacklist__filter_none(sequence):
     expected = FILTER_FILENAMES
@@ -473,6 +496,11 @@ def test_is_subtitle__false(container):
     assert is_subtitle(container) is False
 
 
+@pytest.mark.usefixtures("setup_test_dir")
+def test_json_loads__missing():
+    assert json_loads("missing.json") == {}
+
+
 def test_normalize_container__has_no_dot():
     expected = ".mkv"
     actual = normalize_container("mkv")
@@ -486,7 +514,7 @@ def test_normalize_container__has_dot():
 
 
 @pytest.mark.parametrize("code", [200, 201, 209, 400, 500])
-@patch("mnamer.utils.requests_cache.CachedSession.request")
+@patch("mnamer.utils.Session.request")
 def test_request_json__status(mock_request, code):
     mock_response = MockRequestResponse(code, "{}")
     mock_request.return_value = mock_response
@@ -497,7 +525,7 @@ def test_request_json__status(mock_request, code):
 @pytest.mark.parametrize(
     "code, truthy", [(200, True), (299, True), (400, False), (500, False)]
 )
-@patch("mnamer.utils.requests_cache.CachedSession.request")
+@patch("mnamer.utils.Session.request")
 def test_request_json__data(mock_request, code, truthy):
     mock_response = MockRequestResponse(code, '{"status":true}')
     mock_request.return_value = mock_response
@@ -505,7 +533,7 @@ def test_request_json__data(mock_request, code, truthy):
     assert content if truthy else not content
 
 
-@patch("mnamer.utils.requests_cache.CachedSession.request")
+@patch("mnamer.utils.Session.request")
 def test_request_json__json_data(mock_request):
     json_data = """{
         "status": true,
@@ -526,7 +554,7 @@ def test_request_json__json_data(mock_request):
     assert content == json_dict
 
 
-@patch("mnamer.utils.requests_cache.CachedSession.request")
+@patch("mnamer.utils.Session.request")
 def test_request_json__xml_data(mock_request):
     xml_data = """
         <?xml version="1.0" encoding="UTF-8" ?>
@@ -545,7 +573,7 @@ def test_request_json__xml_data(mock_request):
     assert content is None
 
 
-@patch("mnamer.utils.requests_cache.CachedSession.request")
+@patch("mnamer.utils.Session.request")
 def test_request_json__html_data(mock_request):
     html_data = """
         <!DOCTYPE html>
@@ -635,6 +663,15 @@ def test_request_json__failure(mock_request):
     assert content is None
 
 
+@patch("mnamer.utils.requests_cache.CachedSession.request")
+@patch("mnamer.utils.Session.request")
+def test_request_json__uncached_session(mock_uncached, mock_cached):
+    mock_uncached.return_value = MockRequestResponse(200, "{}")
+    request_json("http://...", cache=False)
+    mock_uncached.assert_called_once()
+    mock_cached.assert_not_called()
+
+
 @pytest.mark.parametrize("s", ("()x", "x()", "()[]x", "[]x()()"))
 def test_str_fix_padding__strip_empty_brackets(s: str):
     expected = "x"